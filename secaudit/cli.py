@@ -1,6 +1,7 @@
 """SecAudit CLI — Entry point for the security scanner."""
 
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -8,11 +9,18 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from secaudit import __app_name__, __version__
+from secaudit.config import MAX_SCAN_BYTES
 from secaudit.core.pipeline import run_scan
 from secaudit.models import HIGH, LOW, MEDIUM, ScanResult
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # App & Console
 # ---------------------------------------------------------------------------
@@ -36,6 +44,13 @@ _SEVERITY_COLORS: dict[str, str] = {
     LOW: "blue",
 }
 
+# Pre-styled severity cells, built once and shared by every table row
+# (a styled Text also skips Rich's per-cell markup parsing)
+_SEVERITY_CELLS: dict[str, Text] = {
+    severity: Text(severity, style=f"bold {color}")
+    for severity, color in _SEVERITY_COLORS.items()
+}
+
 # ---------------------------------------------------------------------------
 # Version callback
 # ---------------------------------------------------------------------------
@@ -88,6 +103,17 @@ def scan(
         "--fail-on",
         help="Exit with code 1 if any issue meets this severity (HIGH, MEDIUM, LOW).",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Rescan every file instead of reusing results for unchanged files.",
+    ),
+    max_file_size: int = typer.Option(
+        MAX_SCAN_BYTES,
+        "--max-file-size",
+        min=1,
+        help="Skip files larger than this many bytes.",
+    ),
 ) -> None:
     """Scan a JavaScript/Node.js project for security issues."""
 
@@ -125,7 +151,7 @@ def scan(
         console.print(f"[dim]Target:[/dim] {target}\n")
         console.print("[bold]Scanning…[/bold]\n")
 
-    result = run_scan(target)
+    result = run_scan(target, use_cache=not no_cache, max_file_bytes=max_file_size)
 
     # --- Output ---
     if output_json:
@@ -149,8 +175,33 @@ def scan(
 
 
 def _print_json(result: ScanResult) -> None:
-    """Print scan results as structured JSON."""
-    print(json.dumps(result.to_dict(), indent=2))
+    """Print scan results as structured JSON.
+
+    Uses ``orjson`` when it is installed: it serializes the slotted
+    ``Issue`` dataclasses natively, so no per-issue dict is built, and
+    writes UTF-8 bytes straight to stdout's binary buffer (decoded first
+    if stdout has none).  Falls back to :mod:`json`.
+    """
+    if orjson is None:
+        print(json.dumps(result.to_dict(), indent=2))
+        return
+
+    payload = {
+        "total_files": result.total_files,
+        "files_skipped": result.files_skipped,
+        "total_issues": len(result.issues),
+        "severity": result.severity_counts,
+        "issues": result.issues,
+    }
+    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only stream (io.StringIO, IDE or notebook capture)
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 def _print_rich(result: ScanResult) -> None:
@@ -181,16 +232,20 @@ def _print_issues_table(result: ScanResult) -> None:
     table.add_column("Severity", justify="center")
     table.add_column("Message", max_width=50)
 
-    for idx, issue in enumerate(result.issues, start=1):
-        color = _SEVERITY_COLORS.get(issue.severity, "white")
-        table.add_row(
+    rows = [
+        (
             str(idx),
             issue.file_path,
             str(issue.line_number),
             issue.issue_type,
-            f"[bold {color}]{issue.severity}[/bold {color}]",
+            _SEVERITY_CELLS.get(issue.severity)
+            or Text(issue.severity, style="bold white"),
             issue.message,
         )
+        for idx, issue in enumerate(result.issues, start=1)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print()
@@ -202,6 +257,7 @@ def _print_summary(result: ScanResult) -> None:
 
     summary_lines = [
         f"[bold]Files scanned:[/bold] {result.total_files}",
+        f"[bold]Files skipped:[/bold] {result.files_skipped}",
         f"[bold]Total issues:[/bold]  {len(result.issues)}",
         "",
         f"[bold red]HIGH:[/bold red]   {sc.get(HIGH, 0)}",
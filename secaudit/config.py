@@ -6,29 +6,59 @@ APP_NAME: str = __app_name__
 VERSION: str = __version__
 
 # Directories / files to skip during scanning
-DEFAULT_IGNORE_DIRS: list[str] = [
-    "node_modules",
-    ".git",
-    "dist",
-    "build",
-    "coverage",
-    ".next",
-]
-
-DEFAULT_IGNORE_FILES: set[str] = {
-    "package-lock.json",
-    "yarn.lock",
-    "pnpm-lock.yaml",
-    "poetry.lock",
-    "Pipfile.lock",
-}
-
-DEFAULT_SCAN_EXTENSIONS: list[str] = [
+DEFAULT_IGNORE_DIRS: frozenset[str] = frozenset(
+    {
+        "node_modules",
+        ".git",
+        "dist",
+        "build",
+        "coverage",
+        ".next",
+    }
+)
+
+DEFAULT_IGNORE_FILES: frozenset[str] = frozenset(
+    {
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "Pipfile.lock",
+    }
+)
+
+# Ordered roughly by frequency so ``str.endswith`` short-circuits early
+DEFAULT_SCAN_EXTENSIONS: tuple[str, ...] = (
     ".js",
-    ".jsx",
     ".ts",
     ".tsx",
+    ".jsx",
     ".mjs",
     ".cjs",
     ".env",
-]
+)
+
+# Per-project result caches live in the user's cache directory, never in the
+# scanned tree; this environment variable overrides the location
+CACHE_DIR_ENV: str = "SECAUDIT_CACHE_DIR"
+
+# Parallel scanning — projects smaller than this are scanned serially
+PARALLEL_MIN_FILES: int = 100
+PARALLEL_CHUNK_SIZE: int = 32
+
+# Files larger than this are not scanned at all
+MAX_SCAN_BYTES: int = 2 * 1024 * 1024
+
+# Files with a NUL byte in their first BINARY_SNIFF_BYTES bytes are treated
+# as binary and not scanned
+BINARY_SNIFF_BYTES: int = 512
+
+# Files at least this large are memory-mapped when read; smaller ones are
+# read with a single os.read(), which is cheaper than setting up a mapping
+MMAP_MIN_BYTES: int = 64 * 1024
+
+# A file whose first MINIFIED_SAMPLE_LINES lines include one longer than
+# MINIFIED_LINE_LENGTH is treated as a minified bundle: it is still checked
+# for secrets, but the insecure-pattern scanner is skipped
+MINIFIED_LINE_LENGTH: int = 5000
+MINIFIED_SAMPLE_LINES: int = 50
@@ -0,0 +1,176 @@
+"""Persistent per-project scan cache.
+
+Repeated scans of the same tree (CI re-runs, pre-commit hooks) mostly see
+unchanged files.  The cache maps each scanned file's path to its
+``(mtime_ns, size)`` and the issues it produced last time, so unchanged
+files are served without being read.
+
+The cache is stamped with a fingerprint of the scanner code: any change to
+a rule, threshold or the package version invalidates it as a whole.  Where
+that code cannot be read, caching is off (see :func:`cache_enabled`).  It is
+stored as JSON in the user's cache directory (see :func:`cache_dir`), one
+file per scanned root, and replaced atomically on save.  Nothing is read
+from or written to the scanned tree: a cache planted there could hide
+findings, and the cached snippets would copy every secret found into it.
+"""
+
+import functools
+import hashlib
+import importlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from secaudit import __version__
+from secaudit.config import CACHE_DIR_ENV
+from secaudit.models import Issue
+
+# Modules whose source decides what a scan reports
+_FINGERPRINT_MODULES: tuple[str, ...] = (
+    "secaudit.config",
+    "secaudit.models",
+    "secaudit.utils",
+    "secaudit.core.pipeline",
+    "secaudit.scanners.multimatch",
+    "secaudit.scanners.patterns",
+    "secaudit.scanners.secrets",
+)
+
+
+@functools.cache
+def ruleset_fingerprint() -> str | None:
+    """Return a digest of the package version and the scanner sources.
+
+    Computed once per process.  Returns ``None`` when the sources cannot
+    be read (zipapps, frozen binaries, ``.pyc``-only installs); caching is
+    then turned off, since the version alone may not change with a rule.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    for name in _FINGERPRINT_MODULES:
+        try:
+            digest.update(Path(importlib.import_module(name).__file__).read_bytes())
+        except (OSError, TypeError):
+            # TypeError: __file__ is missing (None)
+            return None
+    return digest.hexdigest()
+
+
+def cache_enabled() -> bool:
+    """Return ``True`` if scan results can be cached in this install."""
+    return ruleset_fingerprint() is not None
+
+
+def cache_dir() -> Path:
+    """Return the directory that holds scan caches.
+
+    ``$SECAUDIT_CACHE_DIR`` if set, else ``secaudit`` under
+    ``$XDG_CACHE_HOME`` (default ``~/.cache``).
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "secaudit"
+
+
+def cache_path(root_path: Path) -> Path:
+    """Return the cache file used for scans of *root_path*."""
+    root = str(Path(root_path).resolve())
+    return cache_dir() / f"{hashlib.sha256(root.encode()).hexdigest()}.json"
+
+
+class ScanCache:
+    """Issues from a previous scan, keyed by file path.
+
+    Only entries looked up or stored during the current run are written
+    back by :meth:`save`, so files that were deleted or are no longer
+    scanned drop out of the cache.
+
+    Attributes:
+        path: Location of the cache file.
+        root: Resolved root directory the cache belongs to.
+    """
+
+    __slots__ = ("path", "root", "_entries", "_fresh")
+
+    def __init__(
+        self, path: Path, root: str, entries: dict[str, list] | None = None
+    ) -> None:
+        self.path = path
+        self.root = root
+        self._entries: dict[str, list] = entries or {}
+        self._fresh: dict[str, list] = {}
+
+    @classmethod
+    def load(cls, root_path: Path) -> "ScanCache":
+        """Load the cache kept for *root_path*.
+
+        A missing, unreadable or stale cache yields an empty one.
+        """
+        root = str(Path(root_path).resolve())
+        path = cache_path(root_path)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return cls(path, root)
+
+        if (
+            not isinstance(data, dict)
+            or data.get("fingerprint") != ruleset_fingerprint()
+            or data.get("root") != root
+        ):
+            return cls(path, root)
+        files = data.get("files")
+        return cls(path, root, files if isinstance(files, dict) else None)
+
+    def get(self, filepath: str, mtime_ns: int, size: int) -> list[Issue] | None:
+        """Return the cached issues for *filepath*, or ``None`` on a miss.
+
+        Malformed entries are treated as misses.
+        """
+        entry = self._entries.get(filepath)
+        if not isinstance(entry, list) or len(entry) != 3:
+            return None
+        if entry[0] != mtime_ns or entry[1] != size:
+            return None
+        try:
+            issues = [Issue(**fields) for fields in entry[2]]
+        except (TypeError, IndexError, KeyError, ValueError):
+            return None  # Malformed entry — rescan the file
+        self._fresh[filepath] = entry
+        return issues
+
+    def put(self, filepath: str, mtime_ns: int, size: int, issues: list[Issue]) -> None:
+        """Record the issues found in *filepath* at this mtime and size."""
+        self._fresh[filepath] = [mtime_ns, size, [issue.to_dict() for issue in issues]]
+
+    def save(self) -> None:
+        """Write the cache atomically, readable by the owner only.
+
+        Failures are ignored.
+        """
+        payload = {
+            "fingerprint": ruleset_fingerprint(),
+            "root": self.root,
+            "files": self._fresh,
+        }
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with mode 0600
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp"
+            )
+        except OSError:
+            return  # e.g. no writable home directory
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,95 @@
+"""Fan-out of per-file work across a worker pool.
+
+Shared by the unified pipeline and the standalone scanner wrappers.
+"""
+
+import functools
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TypeVar
+
+from secaudit.config import MAX_SCAN_BYTES, PARALLEL_CHUNK_SIZE, PARALLEL_MIN_FILES
+from secaudit.utils import FileWalkResult, read_text_file
+
+# Set to ``thread`` to scan with a thread pool instead of worker processes
+# (useful when the tree lives on a slow network mount and I/O dominates).
+EXECUTOR_ENV_VAR: str = "SECAUDIT_EXECUTOR"
+
+_T = TypeVar("_T")
+
+
+def _make_executor() -> Executor:
+    """Return the pool used to fan out per-file scans.
+
+    Regex matching is CPU-bound and holds the GIL, so processes are the
+    default; ``SECAUDIT_EXECUTOR=thread`` switches to a thread pool.
+
+    On Linux, workers are forked so they inherit the already-imported
+    scanner modules and their compiled regexes rather than re-importing
+    (and re-compiling) them as ``spawn``/``forkserver`` workers would.
+    """
+    if os.environ.get(EXECUTOR_ENV_VAR, "").lower() == "thread":
+        return ThreadPoolExecutor()
+    if sys.platform == "linux":
+        return ProcessPoolExecutor(mp_context=multiprocessing.get_context("fork"))
+    return ProcessPoolExecutor()
+
+
+def map_paths(func: Callable[[str], _T], paths: list[str]) -> list[_T]:
+    """Apply *func* to every path, in parallel when there are enough of them.
+
+    Lists shorter than ``PARALLEL_MIN_FILES`` are processed serially to
+    avoid pool start-up cost.  *func* must be a module-level function so
+    it can be pickled to worker processes.  If no pool can be started, or
+    a worker dies, every path is processed serially instead.
+
+    Returns:
+        One result per path, in the same order as *paths*.
+    """
+    if len(paths) < PARALLEL_MIN_FILES:
+        return list(map(func, paths))
+    try:
+        with _make_executor() as executor:
+            return list(executor.map(func, paths, chunksize=PARALLEL_CHUNK_SIZE))
+    except (OSError, ImportError, BrokenProcessPool):
+        # No POSIX semaphores or /dev/shm (AWS Lambda, some sandboxes), or a
+        # killed worker
+        return list(map(func, paths))
+
+
+def _read_and_scan(
+    scan_file: Callable[[str, str], list[_T]], filepath: str
+) -> list[_T]:
+    """Read *filepath* and scan it; module-level so workers can unpickle it."""
+    content = read_text_file(filepath)
+    if content is None:
+        return []
+    return scan_file(filepath, content)
+
+
+def scan_walked_files(
+    scan_file: Callable[[str, str], list[_T]], walk: FileWalkResult
+) -> list[_T]:
+    """Run *scan_file* over the content of every file in *walk*.
+
+    Files over ``MAX_SCAN_BYTES`` are skipped without being opened, and
+    binary files after a short sniff.  Large walks are scanned in
+    parallel through :func:`map_paths`, so *scan_file* (called as
+    ``scan_file(path, content)``) must be a module-level function.
+
+    Returns:
+        Every file's results, concatenated in walk order.
+    """
+    paths = [
+        filepath
+        for filepath, size in zip(walk.files, walk.sizes)
+        if size <= MAX_SCAN_BYTES
+    ]
+    results: list[_T] = []
+    for file_results in map_paths(functools.partial(_read_and_scan, scan_file), paths):
+        results.extend(file_results)
+    return results
@@ -7,44 +7,116 @@ to every registered scanner, collecting results into a single
 
 from pathlib import Path
 
-from secaudit.models import HIGH, LOW, MEDIUM, Issue, ScanResult
+from secaudit.config import (
+    MAX_SCAN_BYTES,
+    MINIFIED_LINE_LENGTH,
+    MINIFIED_SAMPLE_LINES,
+)
+from secaudit.core.cache import ScanCache, cache_enabled
+from secaudit.core.parallel import map_paths
+from secaudit.models import Issue, ScanResult
 from secaudit.scanners.patterns import scan_file_for_patterns
 from secaudit.scanners.secrets import scan_file_for_secrets
-from secaudit.utils import walk_project_files
+from secaudit.utils import LINE_BREAK_RE, read_text_file, walk_project_files
 
 
-def run_scan(root_path: Path) -> ScanResult:
+def _looks_minified(content: str) -> bool:
+    """Return ``True`` if one of the first lines of *content* is huge.
+
+    Minified bundles pack everything onto a few very long lines, which
+    are slow to regex-scan and almost never hand-written code.
+    """
+    if len(content) <= MINIFIED_LINE_LENGTH:
+        return False
+
+    # Lines end where str.splitlines() ends them, as in the scanners; each
+    # search stops one character past the longest acceptable line
+    start = 0
+    for _ in range(MINIFIED_SAMPLE_LINES):
+        end = LINE_BREAK_RE.search(content, start, start + MINIFIED_LINE_LENGTH + 2)
+        if end is None:
+            return len(content) - start > MINIFIED_LINE_LENGTH
+        if end.start() - start > MINIFIED_LINE_LENGTH:
+            return True
+        start = end.end()
+    return False
+
+
+def _scan_one(filepath: str) -> list[Issue]:
+    """Read *filepath* once and run every per-file scanner over it.
+
+    Defined at module level so it can be pickled and dispatched to
+    worker processes — only the path crosses the process boundary.
+    """
+    content = read_text_file(filepath)
+    if content is None:
+        return []
+
+    issues = scan_file_for_secrets(filepath, content)
+    if not _looks_minified(content):
+        issues.extend(scan_file_for_patterns(filepath, content))
+    return issues
+
+
+def run_scan(
+    root_path: Path,
+    *,
+    use_cache: bool = False,
+    max_file_bytes: int | None = None,
+) -> ScanResult:
     """Execute a full security scan on *root_path*.
 
     Files are walked **once**.  Each file is read **once** and its
-    content is handed to all registered per-file scanners.
+    content is handed to all registered per-file scanners.  Sizes come
+    from the walk, so empty files and files over *max_file_bytes* are
+    set aside without being opened; binary files are dropped after a
+    short sniff, and minified bundles only get the secret scan.  Projects
+    with at least ``PARALLEL_MIN_FILES`` files are scanned in parallel;
+    smaller ones stay serial to avoid pool start-up cost.
 
     Args:
         root_path: Root directory of the project to scan.
+        use_cache: Serve files whose mtime and size are unchanged from
+            the :class:`~secaudit.core.cache.ScanCache` kept for
+            *root_path* in the user's cache directory, and update it
+            afterwards.  Ignored where the scanner sources cannot be
+            fingerprinted.
+        max_file_bytes: Size limit above which files are counted as
+            skipped instead of scanned (default: ``MAX_SCAN_BYTES``).
 
     Returns:
         A :class:`ScanResult` containing all findings and metadata.
     """
+    if max_file_bytes is None:
+        max_file_bytes = MAX_SCAN_BYTES
+
     all_issues: list[Issue] = []
     walk = walk_project_files(root_path)
+    cache = ScanCache.load(root_path) if use_cache and cache_enabled() else None
 
-    for filepath in walk.files:
-        try:
-            with open(filepath, encoding="utf-8", errors="ignore") as fh:
-                content = fh.read()
-        except (OSError, PermissionError):
-            continue
+    # (path, mtime_ns, size, cached issues or None) for each file to report on
+    candidates: list[tuple[str, int, int, list[Issue] | None]] = []
+    files_skipped = 0
+    for filepath, size, mtime_ns in zip(walk.files, walk.sizes, walk.mtimes):
+        if size > max_file_bytes:
+            files_skipped += 1
+        elif size:
+            cached = cache.get(filepath, mtime_ns, size) if cache is not None else None
+            candidates.append((filepath, mtime_ns, size, cached))
 
-        all_issues.extend(scan_file_for_secrets(filepath, content))
-        all_issues.extend(scan_file_for_patterns(filepath, content))
+    scanned = iter(map_paths(_scan_one, [c[0] for c in candidates if c[3] is None]))
+    for filepath, mtime_ns, size, issues in candidates:
+        if issues is None:
+            issues = next(scanned)
+            if cache is not None:
+                cache.put(filepath, mtime_ns, size, issues)
+        all_issues.extend(issues)
 
-    # Build severity counts
-    severity_counts: dict[str, int] = {HIGH: 0, MEDIUM: 0, LOW: 0}
-    for issue in all_issues:
-        severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+    if cache is not None:
+        cache.save()
 
     return ScanResult(
         issues=all_issues,
         total_files=walk.files_scanned,
-        severity_counts=severity_counts,
+        files_skipped=files_skipped,
     )
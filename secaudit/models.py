@@ -1,6 +1,8 @@
 """SecAudit data models for scan findings."""
 
+from collections import Counter
 from dataclasses import dataclass, field
+from typing import Any
 
 
 # ---------------------------------------------------------------------------
@@ -23,10 +25,13 @@ SEVERITY_ORDER: dict[str, int] = {
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     """Represents a single security finding detected during a scan.
 
+    Slotted and immutable: scans can produce many thousands of findings,
+    and dropping the per-instance ``__dict__`` keeps them small.
+
     Attributes:
         file_path: Absolute or relative path to the affected file.
         line_number: 1-based line number where the issue was found.
@@ -51,54 +56,61 @@ class Issue:
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary representation."""
-        return {
-            "file_path": self.file_path,
-            "line_number": self.line_number,
-            "issue_type": self.issue_type,
-            "severity": self.severity,
-            "message": self.message,
-            "snippet": self.snippet,
-        }
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 # ---------------------------------------------------------------------------
 # ScanResult model
 # ---------------------------------------------------------------------------
 
+# Default for ScanResult.severity_counts meaning "derive from the issues".
+# Typed Any so the field itself can be annotated dict[str, int]
+_DERIVE_COUNTS: Any = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanResult:
     """Aggregated result from a complete scan run.
 
     Attributes:
         issues: All detected issues across every scanner.
         total_files: Number of files that were inspected.
-        severity_counts: Breakdown of issues by severity level.
+        severity_counts: Breakdown of issues by severity level.  Derived
+            from *issues* when not supplied.
+        files_skipped: Number of files left unscanned for exceeding the
+            size limit.
     """
 
     issues: list[Issue] = field(default_factory=list)
     total_files: int = 0
-    severity_counts: dict[str, int] = field(
-        default_factory=lambda: {HIGH: 0, MEDIUM: 0, LOW: 0}
-    )
+    severity_counts: dict[str, int] = _DERIVE_COUNTS
+    files_skipped: int = 0
+
+    def __post_init__(self) -> None:
+        if self.severity_counts is _DERIVE_COUNTS:
+            self.severity_counts = {HIGH: 0, MEDIUM: 0, LOW: 0}
+            self.severity_counts.update(Counter(i.severity for i in self.issues))
 
     # --- helpers ---
 
     def has_severity(self, level: str) -> bool:
         """Return ``True`` if any issue meets or exceeds *level*.
 
-        Severity ordering: ``HIGH > MEDIUM > LOW``.
+        Severity ordering: ``HIGH > MEDIUM > LOW``.  Answered from
+        ``severity_counts``, so the cost does not grow with the number
+        of issues.
         """
         threshold = SEVERITY_ORDER.get(level, 0)
         return any(
-            SEVERITY_ORDER.get(issue.severity, 0) >= threshold
-            for issue in self.issues
+            count > 0 and SEVERITY_ORDER.get(severity, 0) >= threshold
+            for severity, count in self.severity_counts.items()
         )
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary of the full scan result."""
         return {
             "total_files": self.total_files,
+            "files_skipped": self.files_skipped,
             "total_issues": len(self.issues),
             "severity": dict(self.severity_counts),
             "issues": [issue.to_dict() for issue in self.issues],
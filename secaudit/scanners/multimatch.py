@@ -0,0 +1,191 @@
+"""Optional multi-pattern rule prefilter (Hyperscan or RE2).
+
+Hyperscan compiles a whole rule set into one automaton and reports, in a
+single linear-time pass, which rules match anywhere in a buffer.  Scanners
+use it to skip rules that cannot fire on a file; the rules' own regexes
+still locate the matches that get reported, so findings are identical
+whether or not an accelerator is installed.  Where Hyperscan is
+unavailable (it only ships x86-64 wheels), an RE2 ``Set`` does the same
+job.  :func:`compile_ascii_regex` compiles single rules with RE2.
+
+Install the accelerators with ``pip install "secaudit[fast]"``.  Without
+either, :func:`compile_prefilter` returns ``None`` and scanners fall back
+to their plain substring gates.
+"""
+
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import hyperscan
+except ImportError:  # optional dependency
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # optional dependency
+    re2 = None
+
+
+# Python's ``\s`` on ASCII text.  Hyperscan's ``\s`` leaves out \x1c-\x1f
+# and RE2's also \v, so patterns for both engines spell the set out instead
+# (as \x0b: to Hyperscan, ``\v`` means any vertical whitespace)
+_ASCII_SPACE: str = r"\t\n\x0b\f\r\x1c-\x1f "
+
+
+def _spell_out_whitespace(pattern: str) -> str:
+    """Replace every ``\\s`` in *pattern* with ``_ASCII_SPACE``.
+
+    Inside a character class the characters are spliced in; elsewhere
+    they become a class of their own.  Classes opening with a literal
+    ``]`` are not recognised (no rule uses one).
+    """
+    out: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escape = pattern[i : i + 2]
+            if escape == r"\s":
+                out.append(_ASCII_SPACE if in_class else f"[{_ASCII_SPACE}]")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+class RulePrefilter:
+    """Reports which of a fixed set of named regexes occur in a text.
+
+    Attributes:
+        names: Rule names, in the order they were compiled.
+    """
+
+    __slots__ = ("names", "_db", "_local")
+
+    def __init__(self, rules: Sequence[tuple[str, str]]) -> None:
+        self.names: tuple[str, ...] = tuple(name for name, _ in rules)
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[
+                _spell_out_whitespace(pattern).encode() for _, pattern in rules
+            ],
+            ids=list(range(len(rules))),
+            elements=len(rules),
+            # One callback per rule, however often it matches
+            flags=hyperscan.HS_FLAG_SINGLEMATCH,
+        )
+        # Scratch space may not be shared between concurrent scans
+        self._local = threading.local()
+
+    def matching(self, text: str) -> set[str] | None:
+        """Return the names of the rules that match somewhere in *text*.
+
+        Returns ``None`` for non-ASCII text: Hyperscan's ``\\w`` / ``\\s`` /
+        ``\\b`` are ASCII-only (and ``\\b`` is unsupported in its Unicode
+        mode), so only for ASCII input does the answer agree with Python's
+        ``re``.  Callers then check every rule themselves.
+        """
+        if not text.isascii():
+            return None
+
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._db)
+
+        found: set[str] = set()
+        names = self.names
+
+        def on_match(rule_id: int, *_: object) -> None:
+            found.add(names[rule_id])
+
+        self._db.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+        return found
+
+
+class RE2RulePrefilter:
+    """:class:`RulePrefilter` counterpart backed by an RE2 ``Set``.
+
+    Attributes:
+        names: Rule names, in the order they were compiled.
+    """
+
+    __slots__ = ("names", "_set")
+
+    def __init__(self, rules: Sequence[tuple[str, str]]) -> None:
+        self.names: tuple[str, ...] = tuple(name for name, _ in rules)
+        self._set = re2.Set.SearchSet(re2.Options())
+        for _, pattern in rules:
+            self._set.Add(_spell_out_whitespace(pattern))
+        self._set.Compile()
+
+    def matching(self, text: str) -> set[str] | None:
+        """Return the names of the rules that match somewhere in *text*.
+
+        Returns ``None`` for non-ASCII text, for the same reason as
+        :meth:`RulePrefilter.matching`: RE2's ``\\s`` and ``\\b`` are
+        ASCII-only too.  The set is safe to share between threads.
+        """
+        if not text.isascii():
+            return None
+
+        ids = self._set.Match(text)
+        if not ids:
+            return set()
+        names = self.names
+        return {names[rule_id] for rule_id in ids}
+
+
+def compile_prefilter(
+    rules: Sequence[tuple[str, str]],
+) -> RulePrefilter | RE2RulePrefilter | None:
+    """Compile *rules* (``(name, pattern)`` pairs) into a prefilter.
+
+    Hyperscan is preferred; RE2 is tried when Hyperscan is not installed
+    or rejects one of the patterns.  Every ``\\s`` matches what it does in
+    Python's ``re`` on ASCII text.
+
+    Returns:
+        The prefilter, or ``None`` if no installed library can compile
+        every pattern.
+    """
+    if hyperscan is not None:
+        try:
+            return RulePrefilter(rules)
+        except hyperscan.error:
+            pass
+    if re2 is not None:
+        try:
+            return RE2RulePrefilter(rules)
+        except re2.error:
+            return None
+    return None
+
+
+def compile_ascii_regex(pattern: str) -> Any | None:
+    """Compile *pattern* with RE2, for matching ASCII text only.
+
+    RE2's ``finditer`` accepts the same calls as ``re.Pattern.finditer``
+    and runs in linear time.  Its ``\\w`` and case folding are ASCII-only,
+    so results agree with Python's ``re`` only on ASCII text; ``\\s`` is
+    spelled out to match what it does in ``re`` there.
+
+    Returns:
+        The compiled pattern, or ``None`` if RE2 is not installed or
+        rejects the pattern.
+    """
+    if re2 is None:
+        return None
+    try:
+        return re2.compile(_spell_out_whitespace(pattern))
+    except re2.error:
+        return None
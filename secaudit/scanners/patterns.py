@@ -6,37 +6,111 @@ in JavaScript/Node.js Express applications.
 """
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
+from secaudit.core.parallel import scan_walked_files
 from secaudit.models import HIGH, MEDIUM, Issue
-from secaudit.utils import walk_project_files
+from secaudit.scanners.multimatch import compile_prefilter
+from secaudit.utils import LineIndex, walk_project_files
 
 # ---------------------------------------------------------------------------
-# 1. Dangerous code execution patterns (line-by-line)
+# 1. Dangerous code execution patterns
 # ---------------------------------------------------------------------------
 
-_DANGEROUS_EXEC_RULES: list[tuple[re.Pattern[str], str]] = [
-    (re.compile(r"\beval\s*\("), "eval()"),
-    (re.compile(r"\bnew\s+Function\s*\("), "new Function()"),
-    (re.compile(r"child_process\s*\.\s*exec\s*\("), "child_process.exec()"),
-    (re.compile(r"child_process\s*\.\s*spawn\s*\("), "child_process.spawn()"),
+# Each rule is (group_name, anchor, pattern, label).  *anchor* is the literal
+# every match starts with.  All rules are fused into one alternation.
+_DANGEROUS_EXEC_RULES: list[tuple[str, str, str, str]] = [
+    ("eval", "eval", r"\beval\s*\(", "eval()"),
+    ("new_function", "new", r"\bnew\s+Function\s*\(", "new Function()"),
+    ("cp_exec", "child_process", r"child_process\s*\.\s*exec\s*\(", "child_process.exec()"),
+    ("cp_spawn", "child_process", r"child_process\s*\.\s*spawn\s*\(", "child_process.spawn()"),
 ]
 
+_DANGEROUS_EXEC_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, _, pattern, _ in _DANGEROUS_EXEC_RULES)
+)
+_EXEC_ANCHORS: tuple[str, ...] = tuple(
+    dict.fromkeys(anchor for _, anchor, _, _ in _DANGEROUS_EXEC_RULES)
+)
+# Hits on one line are reported in rule order
+_GROUP_TO_ORDER: dict[str, int] = {
+    name: index for index, (name, _, _, _) in enumerate(_DANGEROUS_EXEC_RULES)
+}
+# Messages are formatted once here rather than per finding
+_GROUP_TO_MESSAGE: dict[str, str] = {
+    name: f"Use of {label} detected — potential code injection risk"
+    for name, _, _, label in _DANGEROUS_EXEC_RULES
+}
+
+
 # ---------------------------------------------------------------------------
 # 2. IDOR heuristic helpers
 # ---------------------------------------------------------------------------
 
 _ROUTE_PARAM_RE = re.compile(r"""(app|router)\.(get|post|put|patch|delete)\s*\(\s*["'][^"']*:[a-zA-Z]+""")
+_ROUTE_PARAM_ANCHORS: tuple[str, ...] = ("app.", "router.")
 _REQ_PARAMS_RE = re.compile(r"req\.params\.\w+")
-_VALIDATION_KEYWORDS = re.compile(r"(?i)(joi|zod|validate|parseInt|Number\(|parseFloat|celebrate|express-validator)")
+
+# Matched case-insensitively: substring tests against a lower-cased copy of
+# the file are ~10x faster than an (?i) alternation regex
+_VALIDATION_KEYWORDS: tuple[str, ...] = (
+    "joi",
+    "zod",
+    "validate",
+    "parseint",
+    "number(",
+    "parsefloat",
+    "celebrate",
+    "express-validator",
+)
 
 # ---------------------------------------------------------------------------
 # 3. Express middleware detection
 # ---------------------------------------------------------------------------
 
 _EXPRESS_RE = re.compile(r"\bexpress\s*\(\s*\)")
+_EXPRESS_ANCHORS: tuple[str, ...] = ("express",)
 _HELMET_RE = re.compile(r"\bhelmet\s*\(")
+_HELMET_ANCHORS: tuple[str, ...] = ("helmet",)
 _RATE_LIMIT_RE = re.compile(r"(\brateLimit\s*\(|express-rate-limit)")
+_RATE_LIMIT_ANCHORS: tuple[str, ...] = ("rateLimit", "express-rate-limit")
+
+# File-level checks only make sense for JavaScript / TypeScript sources
+_JS_SOURCE_EXTENSIONS: tuple[str, ...] = (".js", ".ts", ".tsx", ".jsx", ".mjs", ".cjs")
+
+# ---------------------------------------------------------------------------
+# 4. Literal prescreen
+# ---------------------------------------------------------------------------
+
+# Fixed literals, keyed by the check they gate: at least one must appear in
+# a file for that check to match anything.  Plain substring tests are far
+# cheaper than a regex search, so files without a hit never reach the
+# regex engine.
+_LITERAL_TRIGGERS: dict[str, tuple[str, ...]] = {
+    "exec": ("eval", "Function", "child_process"),
+    "express": ("express",),
+    "idor": ("req.params",),
+}
+
+# ---------------------------------------------------------------------------
+# 5. Optional Hyperscan prefilter (None when hyperscan is not installed)
+# ---------------------------------------------------------------------------
+
+_EXEC_RULE_NAMES: frozenset[str] = frozenset(
+    name for name, _, _, _ in _DANGEROUS_EXEC_RULES
+)
+# Both must occur for the IDOR heuristic to fire
+_IDOR_RULE_NAMES: frozenset[str] = frozenset({"route_param", "req_params"})
+
+_PREFILTER_RULES: list[tuple[str, str]] = [
+    (name, pattern) for name, _, pattern, _ in _DANGEROUS_EXEC_RULES
+] + [
+    ("express", _EXPRESS_RE.pattern),
+    ("route_param", _ROUTE_PARAM_RE.pattern),
+    ("req_params", _REQ_PARAMS_RE.pattern),
+]
+_PREFILTER = compile_prefilter(_PREFILTER_RULES)
 
 
 # ---------------------------------------------------------------------------
@@ -44,42 +118,112 @@ _RATE_LIMIT_RE = re.compile(r"(\brateLimit\s*\(|express-rate-limit)")
 # ---------------------------------------------------------------------------
 
 
+def _literal_hits(content: str) -> set[str]:
+    """Return the tags in ``_LITERAL_TRIGGERS`` whose literals occur in *content*."""
+    return {
+        tag
+        for tag, literals in _LITERAL_TRIGGERS.items()
+        if any(literal in content for literal in literals)
+    }
+
+
+def _iter_anchored(
+    pattern: re.Pattern[str],
+    anchors: tuple[str, ...],
+    content: str,
+) -> Iterator[re.Match[str]]:
+    """Yield matches of *pattern* that start at one of *anchors*.
+
+    Every rule in this module begins with a fixed literal, so candidates
+    are located with ``str.find`` (a C-level fast search) and *pattern* is
+    only tried, anchored, at those offsets.  A plain ``search`` cannot
+    skip ahead like this when the pattern opens with ``\\b`` or an
+    alternation, and ends up attempting a match at every position —
+    roughly ten times slower on typical files.  Matches are yielded per
+    anchor, not in file order.
+    """
+    find = content.find
+    for anchor in anchors:
+        pos = find(anchor)
+        while pos != -1:
+            match = pattern.match(content, pos)
+            if match:
+                yield match
+            pos = find(anchor, pos + 1)
+
+
+def _occurs(pattern: re.Pattern[str], anchors: tuple[str, ...], content: str) -> bool:
+    """Return ``True`` if *pattern* matches at one of *anchors* in *content*."""
+    return next(_iter_anchored(pattern, anchors, content), None) is not None
+
+
+def _find_dangerous_exec(content: str, lines: LineIndex) -> list[tuple[int, str]]:
+    """Return ``(line_number, rule)`` for every dangerous-exec match in *content*.
+
+    Sorted by line, and within a line by rule order.
+    """
+    matches = list(_iter_anchored(_DANGEROUS_EXEC_RE, _EXEC_ANCHORS, content))
+    line_numbers = lines.line_numbers([match.start() for match in matches])
+    hits = [
+        (line_num, match.lastgroup) for line_num, match in zip(line_numbers, matches)
+    ]
+    hits.sort(key=lambda hit: (hit[0], _GROUP_TO_ORDER[hit[1]]))
+    return hits
+
+
 def _check_dangerous_exec(
-    line: str,
-    line_num: int,
+    content: str,
     file_path: str,
+    lines: LineIndex,
 ) -> list[Issue]:
-    """Flag dangerous code execution calls on a single line."""
+    """Flag dangerous code execution calls anywhere in *content*.
+
+    Match offsets are mapped back to line numbers through *lines*.
+    """
     issues: list[Issue] = []
-    for pattern, label in _DANGEROUS_EXEC_RULES:
-        if pattern.search(line):
-            issues.append(
-                Issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    issue_type="Dangerous Code Execution",
-                    severity=HIGH,
-                    message=f"Use of {label} detected — potential code injection risk",
-                    snippet=line.strip()[:120],
-                )
+    seen: set[tuple[int, str]] = set()
+    snippet_line, snippet = 0, ""
+    for line_num, rule in _find_dangerous_exec(content, lines):
+        if (line_num, rule) in seen:
+            continue  # Report each call type once per line
+        seen.add((line_num, rule))
+        if line_num != snippet_line:
+            snippet_line, snippet = line_num, lines.line_text(line_num).strip()[:120]
+        issues.append(
+            Issue(
+                file_path=file_path,
+                line_number=line_num,
+                issue_type="Dangerous Code Execution",
+                severity=HIGH,
+                message=_GROUP_TO_MESSAGE[rule],
+                snippet=snippet,
             )
+        )
     return issues
 
 
 def _check_file_level_issues(
     content: str,
     file_path: str,
+    lines: LineIndex,
+    *,
+    express: bool = True,
+    idor: bool = True,
 ) -> list[Issue]:
     """Run file-level heuristics for Express middleware & IDOR.
 
     These checks operate on the entire file content rather than
-    individual lines.
+    individual lines.  Passing ``express=False`` or ``idor=False`` skips
+    a check already known not to apply (its prescreen found nothing).
     """
     issues: list[Issue] = []
-    is_express_app = bool(_EXPRESS_RE.search(content))
+    if not file_path.endswith(_JS_SOURCE_EXTENSIONS):
+        return issues
+
+    is_express_app = express and _occurs(_EXPRESS_RE, _EXPRESS_ANCHORS, content)
 
     # --- Missing Helmet ---
-    if is_express_app and not _HELMET_RE.search(content):
+    if is_express_app and not _occurs(_HELMET_RE, _HELMET_ANCHORS, content):
         issues.append(
             Issue(
                 file_path=file_path,
@@ -92,7 +236,7 @@ def _check_file_level_issues(
         )
 
     # --- Missing Rate Limiting ---
-    if is_express_app and not _RATE_LIMIT_RE.search(content):
+    if is_express_app and not _occurs(_RATE_LIMIT_RE, _RATE_LIMIT_ANCHORS, content):
         issues.append(
             Issue(
                 file_path=file_path,
@@ -104,22 +248,22 @@ def _check_file_level_issues(
             )
         )
 
-    # --- Potential IDOR ---
-    if _ROUTE_PARAM_RE.search(content) and _REQ_PARAMS_RE.search(content):
-        if not _VALIDATION_KEYWORDS.search(content):
-            for line_num, line in enumerate(content.splitlines(), start=1):
-                if _REQ_PARAMS_RE.search(line):
-                    issues.append(
-                        Issue(
-                            file_path=file_path,
-                            line_number=line_num,
-                            issue_type="Potential IDOR Risk",
-                            severity=MEDIUM,
-                            message="Route parameter used without validation — potential IDOR",
-                            snippet=line.strip()[:120],
-                        )
-                    )
-                    break  # Only flag once per file
+    # --- Potential IDOR (flagged once per file, at the first use) ---
+    req_params = _REQ_PARAMS_RE.search(content) if idor else None
+    if req_params and _occurs(_ROUTE_PARAM_RE, _ROUTE_PARAM_ANCHORS, content):
+        lowered = content.lower()
+        if not any(keyword in lowered for keyword in _VALIDATION_KEYWORDS):
+            line_num = lines.line_number(req_params.start())
+            issues.append(
+                Issue(
+                    file_path=file_path,
+                    line_number=line_num,
+                    issue_type="Potential IDOR Risk",
+                    severity=MEDIUM,
+                    message="Route parameter used without validation — potential IDOR",
+                    snippet=lines.line_text(line_num).strip()[:120],
+                )
+            )
 
     return issues
 
@@ -142,13 +286,35 @@ def scan_file_for_patterns(file_path: str, content: str) -> list[Issue]:
         List of detected ``Issue`` objects.
     """
     issues: list[Issue] = []
-
-    # Line-by-line: dangerous execution calls
-    for line_num, line in enumerate(content.splitlines(), start=1):
-        issues.extend(_check_dangerous_exec(line, line_num, file_path))
+    # Line numbers match those of content.splitlines(), as in the secrets
+    # scanner; CR-only files have no "\n" at all
+    lines = LineIndex(content, universal_newlines=True)
+
+    # Which rules occur at all, from one Hyperscan pass (None = unknown)
+    found = _PREFILTER.matching(content) if _PREFILTER is not None else None
+
+    # Each check's prescreen runs once here; the checks below never repeat it
+    if found is None:
+        hits = _literal_hits(content)
+        has_exec = "exec" in hits
+        has_express = "express" in hits
+        has_idor = "idor" in hits
+    else:
+        has_exec = not found.isdisjoint(_EXEC_RULE_NAMES)
+        has_express = "express" in found
+        has_idor = _IDOR_RULE_NAMES <= found
+
+    # Dangerous execution calls
+    if has_exec:
+        issues.extend(_check_dangerous_exec(content, file_path, lines))
 
     # File-level: middleware & IDOR checks
-    issues.extend(_check_file_level_issues(content, file_path))
+    if has_express or has_idor:
+        issues.extend(
+            _check_file_level_issues(
+                content, file_path, lines, express=has_express, idor=has_idor
+            )
+        )
 
     return issues
 
@@ -157,7 +323,9 @@ def scan_for_patterns(root_path: Path) -> tuple[list[Issue], int]:
     """Recursively scan a project for insecure code patterns.
 
     Convenience wrapper that walks files and delegates to
-    :func:`scan_file_for_patterns`.
+    :func:`scan_file_for_patterns`, in parallel for large projects.  Files
+    over ``MAX_SCAN_BYTES`` are skipped without being opened, and binary
+    files after a short sniff.
 
     Args:
         root_path: Root directory of the project to scan.
@@ -165,15 +333,5 @@ def scan_for_patterns(root_path: Path) -> tuple[list[Issue], int]:
     Returns:
         A tuple of ``(issues, files_scanned)``.
     """
-    issues: list[Issue] = []
     walk = walk_project_files(root_path)
-
-    for filepath in walk.files:
-        try:
-            with open(filepath, encoding="utf-8", errors="ignore") as fh:
-                content = fh.read()
-        except (OSError, PermissionError):
-            continue
-        issues.extend(scan_file_for_patterns(filepath, content))
-
-    return issues, walk.files_scanned
+    return scan_walked_files(scan_file_for_patterns, walk), walk.files_scanned
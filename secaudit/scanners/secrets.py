@@ -4,17 +4,41 @@ Detects API keys, AWS credentials, JWT secrets, and high-entropy strings
 in JavaScript/Node.js projects using regex rules and Shannon entropy.
 """
 
+import functools
 import math
 import re
+from collections import Counter
 from pathlib import Path
+from typing import Any
 
+from secaudit.core.parallel import scan_walked_files
 from secaudit.models import HIGH, MEDIUM, Issue
-from secaudit.utils import walk_project_files
+from secaudit.scanners.multimatch import compile_ascii_regex, compile_prefilter
+from secaudit.utils import LineIndex, walk_project_files
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
 
 # ---------------------------------------------------------------------------
 # Regex rules — each tuple is (compiled_pattern, issue_type, severity, msg)
 # ---------------------------------------------------------------------------
 
+# Rules run once over the whole file, so none may match across a line
+# boundary.  This is ``\s`` minus every boundary ``str.splitlines()``
+# recognises: the whitespace that can occur inside a line.
+_INLINE_SPACE = r"\t\x1f \xa0\u1680\u2000-\u200a\u202f\u205f\u3000"
+
+# Keyword followed by an assigned token.  Compiled below behind a lookahead
+# on the keywords' first letters: a case-insensitive alternation gives the
+# engine nothing to skip ahead on, and trying it at every position makes
+# this the most expensive rule by far.  The lookahead cuts that ~3x without
+# changing what matches.
+_GENERIC_KEY_PATTERN = (
+    r"""(api|key|token|secret)["'""" + _INLINE_SPACE + r""":=]+["']?[A-Za-z0-9\-_]{16,}"""
+)
+
 _RULES: list[tuple[re.Pattern[str], str, str, str]] = [
     (
         re.compile(r"AKIA[0-9A-Z]{16}"),
@@ -31,31 +55,71 @@ _RULES: list[tuple[re.Pattern[str], str, str, str]] = [
         "Possible JWT token detected",
     ),
     (
-        re.compile(
-            r"""(?i)(api|key|token|secret)["'\s:=]+["']?[A-Za-z0-9\-_]{16,}"""
-        ),
+        re.compile(r"(?i)(?=[akst])" + _GENERIC_KEY_PATTERN),
         "Generic API Key",
         MEDIUM,
         "Possible hardcoded API key or secret",
     ),
 ]
 
+# One Hyperscan (or RE2) pass over the whole file tells which rules can
+# match at all (None when neither is installed); rules are keyed by issue
+# type.  Neither engine has lookarounds or ``\u`` escapes, so they get a
+# plain generic-key pattern whose ``\s`` (spelled out by the prefilter as
+# Python's ASCII whitespace) also spans line breaks — a superset in the
+# ASCII text the prefilter checks, which is all a prefilter needs.
+_PREFILTER_PATTERNS: dict[str, str] = {
+    "Generic API Key": r"""(?i)(api|key|token|secret)["'\s:=]+["']?[A-Za-z0-9\-_]{16,}""",
+}
+_PREFILTER_RULES: list[tuple[str, str]] = [
+    (issue_type, _PREFILTER_PATTERNS.get(issue_type, pattern.pattern))
+    for pattern, issue_type, _, _ in _RULES
+]
+_PREFILTER = compile_prefilter(_PREFILTER_RULES)
+
+# With google-re2 installed, rules are matched by RE2 in ASCII content: its
+# linear-time engine is 10-20x faster than ``re`` on the JWT and generic-key
+# rules, whose matches are rare.  (It is slower where matches are dense, as
+# for string literals, so the entropy check stays on ``re``.)  RE2 has no
+# lookarounds or ``\u`` escapes; in ASCII text the inline-space class
+# reduces to tab, unit separator and space.  Keyed by issue type.
+_RE2_PATTERNS: dict[str, str] = {
+    "Generic API Key": r"""(?i)(api|key|token|secret)["'\t\x1f :=]+["']?[A-Za-z0-9\-_]{16,}""",
+}
+_RE2_RULES: dict[str, Any] = {
+    issue_type: compiled
+    for pattern, issue_type, _, _ in _RULES
+    if (compiled := compile_ascii_regex(_RE2_PATTERNS.get(issue_type, pattern.pattern)))
+    is not None
+}
+
+# Without a prefilter, rules are gated on literals every match contains:
+# (literals, matched case-insensitively).  A plain substring test runs at
+# memory speed, while a regex search tries a match at every position.  The
+# JWT rule has no such literal and always runs.
+_RULE_LITERALS: dict[str, tuple[tuple[str, ...], bool]] = {
+    "AWS Access Key": (("AKIA",), False),
+    "Generic API Key": (("api", "key", "token", "secret"), True),
+}
+
 # ---------------------------------------------------------------------------
 # Entropy helpers
 # ---------------------------------------------------------------------------
 
-# Regex to find quoted string literals: '...' or "..."
-_STRING_LITERAL_RE = re.compile(r"""(["'])(.*?)\1""")
+# Regex to find quoted string literals: '...' or "..." (within one line)
+_STRING_LITERAL_RE = re.compile(r"""(["'])([^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*?)\1""")
 
-# Safe patterns to exclude from entropy checks
-_SAFE_PATTERNS: list[re.Pattern[str]] = [
+# Safe tokens to exclude from entropy checks, as one alternation that must
+# match the whole token
+_SAFE_TOKEN_RE: re.Pattern[str] = re.compile(
     # UUID v4
-    re.compile(
-        r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-    ),
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
     # Pure hex string (hashes, object IDs)
-    re.compile(r"^[a-fA-F0-9]{32,}$"),
-]
+    r"|[a-fA-F0-9]{32,}"
+)
+# Every character the safe-token regex can match; a token containing anything
+# else (i.e. not emptied by ``str.strip``) cannot be safe
+_SAFE_CHARS: str = "0123456789abcdefABCDEF-"
 
 # Keywords that suggest the string is NOT a secret (e.g. hash context)
 _SAFE_KEYWORDS: set[str] = {"sha", "integrity", "checksum", "md5"}
@@ -64,6 +128,24 @@ _SAFE_KEYWORDS: set[str] = {"sha", "integrity", "checksum", "md5"}
 _ENTROPY_THRESHOLD: float = 4.5
 _MIN_LENGTH: int = 20
 
+# Entropy is at most log₂(k) for k distinct characters, so exceeding the
+# threshold takes more than 2**_ENTROPY_THRESHOLD of them (23 for 4.5)
+_MIN_DISTINCT: int = math.floor(2**_ENTROPY_THRESHOLD) + 1
+
+# Below this length a plain dict tally is cheapest; above it, Counter wins
+_LONG_TEXT_LENGTH: int = 128
+
+# From this length on, a NumPy bincount beats both for ASCII text; below
+# it, array set-up costs more than the tally (~5 µs vs 2-5 µs)
+_NUMPY_MIN_LENGTH: int = 96
+
+# _PLOGP[n][c] is p·log₂(p) for p = c/n, precomputed for every text shorter
+# than _LONG_TEXT_LENGTH so short texts need no log calls
+_PLOGP: list[list[float]] = [[0.0]] + [
+    [0.0] + [(c / n) * math.log2(c / n) for c in range(1, n + 1)]
+    for n in range(1, _LONG_TEXT_LENGTH)
+]
+
 
 def calculate_entropy(text: str) -> float:
     """Calculate Shannon entropy of *text*.
@@ -84,32 +166,92 @@ def calculate_entropy(text: str) -> float:
         return 0.0
 
     length = len(text)
+    if np is not None and length >= _NUMPY_MIN_LENGTH and text.isascii():
+        counts = np.bincount(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
+        p = counts[counts > 0] / length
+        return float(-(p * np.log2(p)).sum())
+
+    if length >= _LONG_TEXT_LENGTH:
+        entropy = 0.0
+        for count in Counter(text).values():
+            p = count / length
+            entropy -= p * math.log2(p)
+        return entropy
+
     freq: dict[str, int] = {}
     for ch in text:
         freq[ch] = freq.get(ch, 0) + 1
 
+    plogp = _PLOGP[length]
     entropy = 0.0
     for count in freq.values():
-        p = count / length
-        entropy -= p * math.log2(p)
-
+        entropy -= plogp[count]
     return entropy
 
 
+# Literals repeat across lines and files (import paths, framework names), so
+# the entropy scan memoizes per worker process
+_cached_entropy = functools.lru_cache(maxsize=4096)(calculate_entropy)
+
+
 # ---------------------------------------------------------------------------
 # Internal scanning helpers
 # ---------------------------------------------------------------------------
 
 
+def _active_rules(content: str) -> list[tuple[re.Pattern[str], str, str, str]]:
+    """Return the entries of ``_RULES`` that can match somewhere in *content*.
+
+    Without a prefilter (or for non-ASCII content) rules are gated on
+    ``_RULE_LITERALS`` instead.  Case-insensitive literals are only
+    checked in ASCII content, where lower-casing maps one-to-one onto what
+    ``(?i)`` matches; otherwise those rules are always returned.
+    """
+    found = _PREFILTER.matching(content) if _PREFILTER is not None else None
+    if found is not None:
+        return [rule for rule in _RULES if rule[1] in found]
+
+    lowered = content.lower() if content.isascii() else None
+    active = []
+    for rule in _RULES:
+        gate = _RULE_LITERALS.get(rule[1])
+        if gate is not None:
+            literals, ignore_case = gate
+            haystack = lowered if ignore_case else content
+            if haystack is not None and not any(literal in haystack for literal in literals):
+                continue
+        active.append(rule)
+    return active
+
+
 def _check_regex_rules(
-    line: str,
-    line_num: int,
+    content: str,
     file_path: str,
+    lines: LineIndex,
+    rules: list[tuple[re.Pattern[str], str, str, str]] = _RULES,
 ) -> list[Issue]:
-    """Apply all regex rules to a single line and return any matches."""
+    """Apply *rules* (default: all regex rules) to the whole of *content*.
+
+    Each rule is reported at most once per line.  Issues come out grouped
+    by rule, in rule order.  ASCII content is matched with the RE2 forms of
+    the rules in ``_RE2_RULES``, where available.
+    """
     issues: list[Issue] = []
-    for pattern, issue_type, severity, message in _RULES:
-        if pattern.search(line):
+    snippets: dict[int, str] = {}
+    re2_rules = _RE2_RULES if _RE2_RULES and content.isascii() else None
+    for pattern, issue_type, severity, message in rules:
+        if re2_rules is not None:
+            pattern = re2_rules.get(issue_type, pattern)
+        offsets = [match.start() for match in pattern.finditer(content)]
+        if not offsets:
+            continue
+        last_line = 0
+        for line_num in lines.line_numbers(offsets):
+            if line_num == last_line:
+                continue  # Already reported on this line
+            last_line = line_num
+            if line_num not in snippets:
+                snippets[line_num] = lines.line_text(line_num).strip()[:120]
             issues.append(
                 Issue(
                     file_path=file_path,
@@ -117,42 +259,47 @@ def _check_regex_rules(
                     issue_type=issue_type,
                     severity=severity,
                     message=message,
-                    snippet=line.strip()[:120],
+                    snippet=snippets[line_num],
                 )
             )
     return issues
 
 
 def _check_entropy(
-    line: str,
-    line_num: int,
+    content: str,
     file_path: str,
+    lines: LineIndex,
 ) -> list[Issue]:
-    """Flag individual tokens on *line* that exhibit high entropy.
+    """Flag string literals in *content* that exhibit high entropy.
 
-    Only checks string literals inside quotes.
+    Only checks string literals inside quotes, and skips lines that
+    mention a safe keyword.
     """
     issues: list[Issue] = []
+    safe_lines: dict[int, bool] = {}
 
-    # Find all quoted string literals
-    matches = _STRING_LITERAL_RE.findall(line)
-    if not matches:
-        return issues
+    for match in _STRING_LITERAL_RE.finditer(content):
+        if match.end(2) - match.start(2) < _MIN_LENGTH:
+            continue
+        literal = match.group(2)
 
-    # Quick check for safe keywords in the full line
-    line_lower = line.lower()
-    if any(k in line_lower for k in _SAFE_KEYWORDS):
-        return issues
+        # Check exclusions (the regex only runs for all-hex tokens)
+        if not literal.strip(_SAFE_CHARS) and _SAFE_TOKEN_RE.fullmatch(literal):
+            continue
 
-    for _, content in matches:
-        if len(content) < _MIN_LENGTH:
+        # Too few distinct characters to reach the threshold
+        if len(set(literal)) < _MIN_DISTINCT:
             continue
 
-        # Check exclusions
-        if any(p.match(content) for p in _SAFE_PATTERNS):
+        # Safe keywords anywhere on the line exempt all of its literals
+        line_num = lines.line_number(match.start())
+        if line_num not in safe_lines:
+            line_lower = lines.line_text(line_num).lower()
+            safe_lines[line_num] = any(k in line_lower for k in _SAFE_KEYWORDS)
+        if safe_lines[line_num]:
             continue
 
-        entropy = calculate_entropy(content)
+        entropy = _cached_entropy(literal)
         if entropy > _ENTROPY_THRESHOLD:
             issues.append(
                 Issue(
@@ -161,7 +308,7 @@ def _check_entropy(
                     issue_type="High Entropy String",
                     severity=MEDIUM,
                     message=f"High entropy string detected (entropy={entropy:.2f})",
-                    snippet=line.strip()[:120],
+                    snippet=lines.line_text(line_num).strip()[:120],
                 )
             )
     return issues
@@ -184,10 +331,16 @@ def scan_file_for_secrets(file_path: str, content: str) -> list[Issue]:
     Returns:
         List of detected ``Issue`` objects.
     """
-    issues: list[Issue] = []
-    for line_num, line in enumerate(content.splitlines(), start=1):
-        issues.extend(_check_regex_rules(line, line_num, file_path))
-        issues.extend(_check_entropy(line, line_num, file_path))
+    # Each check makes one pass over the whole buffer; line numbers match
+    # those of content.splitlines()
+    lines = LineIndex(content, universal_newlines=True)
+    rules = _active_rules(content)
+    issues = _check_regex_rules(content, file_path, lines, rules) if rules else []
+    issues.extend(_check_entropy(content, file_path, lines))
+
+    # Report line by line: rule hits in rule order, then entropy hits
+    # (the sort is stable)
+    issues.sort(key=lambda issue: issue.line_number)
     return issues
 
 
@@ -195,7 +348,8 @@ def scan_for_secrets(root_path: Path) -> tuple[list[Issue], int]:
     """Recursively scan a project directory for hardcoded secrets.
 
     Convenience wrapper that walks files and delegates to
-    :func:`scan_file_for_secrets`.
+    :func:`scan_file_for_secrets`.  Files over ``MAX_SCAN_BYTES`` are
+    skipped without being opened, and binary files after a short sniff.
 
     Args:
         root_path: Root directory of the project to scan.
@@ -203,15 +357,5 @@ def scan_for_secrets(root_path: Path) -> tuple[list[Issue], int]:
     Returns:
         A tuple of ``(issues, files_scanned)``.
     """
-    issues: list[Issue] = []
     walk = walk_project_files(root_path)
-
-    for filepath in walk.files:
-        try:
-            with open(filepath, encoding="utf-8", errors="ignore") as fh:
-                content = fh.read()
-        except (OSError, PermissionError):
-            continue
-        issues.extend(scan_file_for_secrets(filepath, content))
-
-    return issues, walk.files_scanned
+    return scan_walked_files(scan_file_for_secrets, walk), walk.files_scanned
@@ -1,15 +1,27 @@
 """SecAudit utility helpers."""
 
+import mmap
 import os
-from collections.abc import Generator
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Generator, Iterable
 from pathlib import Path
+from stat import S_ISREG
 
 from secaudit.config import (
+    BINARY_SNIFF_BYTES,
     DEFAULT_IGNORE_DIRS,
     DEFAULT_IGNORE_FILES,
     DEFAULT_SCAN_EXTENSIONS,
+    MMAP_MIN_BYTES,
 )
 
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
 
 def validate_path(path: str) -> Path:
     """Resolve and validate that *path* points to an existing directory.
@@ -35,62 +47,211 @@ def validate_path(path: str) -> Path:
     return resolved
 
 
+def read_text_file(path: str) -> str | None:
+    """Read *path* and return its content decoded as UTF-8.
+
+    Bypasses Python's buffered text-I/O stack: small files are read with
+    one sized ``os.read()`` call, and files of ``MMAP_MIN_BYTES`` or more
+    are memory-mapped and decoded straight from the mapping, avoiding the
+    intermediate ``bytes`` copy.  Undecodable bytes are dropped.  Line
+    endings are returned as-is (no universal-newline translation).  A NUL
+    byte in the first ``BINARY_SNIFF_BYTES`` bytes marks the file as
+    binary, and it is not decoded at all.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        The decoded content, or ``None`` if the file could not be read or
+        looks binary.
+    """
+    try:
+        # O_BINARY (Windows only): no CRLF translation, no stop at Ctrl-Z
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return None
+
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return ""
+        if size < MMAP_MIN_BYTES:
+            data = os.read(fd, size)
+            if data.find(b"\0", 0, BINARY_SNIFF_BYTES) != -1:
+                return None
+            return data.decode("utf-8", "ignore")
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(b"\0", 0, BINARY_SNIFF_BYTES) != -1:
+                return None
+            return str(mapped, "utf-8", "ignore")
+    except (OSError, ValueError):
+        # ValueError: the file shrank or was truncated after fstat()
+        return None
+    finally:
+        os.close(fd)
+
+
+_NEWLINE_RE = re.compile("\n")
+# Every line boundary ``str.splitlines()`` recognises; ``\r\n`` is one
+LINE_BREAK_RE = re.compile("\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+
+# Below this many offsets, bisecting each one beats building NumPy arrays
+_VECTORIZE_MIN_OFFSETS: int = 32
+
+
+class LineIndex:
+    """Maps character offsets in a file's content to 1-based line numbers.
+
+    Lets scanners run one ``finditer`` over the whole content and still
+    report per-line locations.  Line starts are computed once, on first
+    use, so files without findings never pay for the index.
+
+    Lines end at ``\n`` by default.  With ``universal_newlines=True`` they
+    end at every boundary ``str.splitlines()`` recognises, so line numbers
+    agree with ``enumerate(content.splitlines(), start=1)``.
+    """
+
+    __slots__ = ("_content", "_breaks", "_starts", "_starts_array")
+
+    def __init__(self, content: str, *, universal_newlines: bool = False) -> None:
+        self._content = content
+        self._breaks = LINE_BREAK_RE if universal_newlines else _NEWLINE_RE
+        self._starts: list[int] | None = None
+        self._starts_array = None
+
+    def _line_starts(self) -> list[int]:
+        if self._starts is None:
+            self._starts = [0]
+            self._starts.extend(m.end() for m in self._breaks.finditer(self._content))
+        return self._starts
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-based number of the line containing *offset*."""
+        return bisect_right(self._line_starts(), offset)
+
+    def line_numbers(self, offsets: list[int]) -> list[int]:
+        """Return the line number of every offset in *offsets*.
+
+        With NumPy installed, batches of at least ``_VECTORIZE_MIN_OFFSETS``
+        are looked up with a single ``searchsorted`` call; smaller ones
+        (or all of them without NumPy) use ``bisect`` per offset.
+        """
+        starts = self._line_starts()
+        if np is None or len(offsets) < _VECTORIZE_MIN_OFFSETS:
+            return [bisect_right(starts, offset) for offset in offsets]
+        if self._starts_array is None:
+            self._starts_array = np.array(starts, dtype=np.int64)
+        return np.searchsorted(self._starts_array, offsets, side="right").tolist()
+
+    def line_text(self, line_number: int) -> str:
+        """Return the text of *line_number*, without its line terminator."""
+        start = self._line_starts()[line_number - 1]
+        end = self._breaks.search(self._content, start)
+        return self._content[start:] if end is None else self._content[start : end.start()]
+
+
 class FileWalkResult:
     """Container returned by :func:`walk_project_files`.
 
     Attributes:
         files: List of absolute file paths that matched the scan criteria.
+        sizes: Size in bytes of each file in *files*, at the same index.
+        mtimes: Modification time (``st_mtime_ns``) of each file in *files*.
         files_scanned: Total number of files that were inspected.
+
+    Sizes and mtimes are kept in typed ``array('q')`` columns, 8 bytes per
+    file instead of a pointer plus an ``int`` object each.
     """
 
-    __slots__ = ("files", "files_scanned")
+    __slots__ = ("files", "sizes", "mtimes", "files_scanned")
 
     def __init__(self) -> None:
         self.files: list[str] = []
+        self.sizes: array[int] = array("q")
+        self.mtimes: array[int] = array("q")
         self.files_scanned: int = 0
 
 
 def walk_project_files(
     root_path: Path,
     *,
-    ignore_dirs: set[str] | None = None,
-    scan_extensions: set[str] | None = None,
+    ignore_dirs: Iterable[str] | None = None,
+    scan_extensions: Iterable[str] | str | None = None,
 ) -> FileWalkResult:
     """Walk a project directory and collect scannable file paths.
 
     Respects ``DEFAULT_IGNORE_DIRS``, ``DEFAULT_IGNORE_FILES``, and
     ``DEFAULT_SCAN_EXTENSIONS`` from config unless overrides are provided.
 
+    Traversal uses ``os.scandir`` with an explicit stack so directory
+    checks come from the cached ``DirEntry`` type instead of an extra
+    ``stat()`` per entry.  Only files that pass the name filters are
+    stat'ed, once, to record their size and modification time and to
+    keep regular files only.  Symlinks are not followed.
+
     Args:
         root_path: Root directory to walk.
-        ignore_dirs: Optional set of directory names to skip.
-        scan_extensions: Optional set of file extensions to include.
+        ignore_dirs: Optional directory names to skip.
+        scan_extensions: Optional file extensions (suffixes) to include.
 
     Returns:
         A :class:`FileWalkResult` with the matching file paths and count.
     """
     _ignore_dirs = (
-        ignore_dirs if ignore_dirs is not None else set(DEFAULT_IGNORE_DIRS)
-    )
-    _extensions = (
-        scan_extensions if scan_extensions is not None else set(DEFAULT_SCAN_EXTENSIONS)
+        frozenset(ignore_dirs) if ignore_dirs is not None else DEFAULT_IGNORE_DIRS
     )
+    # str.endswith() takes a tuple of suffixes and tests them all in one
+    # C call; a bare string override is treated as a single suffix
+    if scan_extensions is None:
+        _extensions = DEFAULT_SCAN_EXTENSIONS
+    elif isinstance(scan_extensions, str):
+        _extensions = (scan_extensions,)
+    else:
+        _extensions = tuple(scan_extensions)
 
+    _ignore_files = DEFAULT_IGNORE_FILES
     result = FileWalkResult()
+    files, sizes, mtimes = result.files, result.sizes, result.mtimes
+    stack = [os.fspath(root_path)]
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable directory — skip it, as os.walk would
+            continue
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    # Answered from the cached d_type on most filesystems;
+                    # falls back to lstat(), which can fail, elsewhere
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if name not in _ignore_dirs:
+                        stack.append(entry.path)
+                    continue
 
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Prune ignored directories in-place so os.walk skips them
-        dirnames[:] = [d for d in dirnames if d not in _ignore_dirs]
+                # The suffix test rejects most entries, so it runs first
+                if not name.endswith(_extensions) or name in _ignore_files:
+                    continue
 
-        for filename in filenames:
-            if filename in DEFAULT_IGNORE_FILES:
-                continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue  # Vanished since the directory was listed
 
-            ext = os.path.splitext(filename)[1]
-            if ext not in _extensions:
-                continue
+                # Regular files only: no symlinks, FIFOs, sockets or devices
+                if not S_ISREG(st.st_mode):
+                    continue
 
-            result.files.append(os.path.join(dirpath, filename))
-            result.files_scanned += 1
+                files.append(entry.path)
+                sizes.append(st.st_size)
+                mtimes.append(st.st_mtime_ns)
 
+    result.files_scanned = len(files)
     return result
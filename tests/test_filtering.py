@@ -1,30 +1,29 @@
 """Unit tests for file filtering and exclusion logic."""
 
 import os
-import tempfile
 from pathlib import Path
 
+import pytest
+
 from secaudit.utils import walk_project_files
 
 
-def _create_test_structure(files: list[str]) -> str:
-    """Create a temporary directory with the given file paths."""
-    tmpdir = tempfile.mkdtemp(prefix="secaudit_filter_")
+def _create_test_structure(root: Path, files: list[str]) -> str:
+    """Create empty files at the given paths under *root* (a ``tmp_path``)."""
     for path in files:
-        full_path = os.path.join(tmpdir, path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        # Create empty file
-        with open(full_path, "w") as f:
-            f.write("")
-    return tmpdir
+        full_path = root / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.touch()
+    return str(root)
 
 
 class TestFileFiltering:
     """Tests for file walker exclusions."""
 
-    def test_ignores_lockfiles(self) -> None:
+    def test_ignores_lockfiles(self, tmp_path: Path) -> None:
         """Lock files should be excluded from the scan."""
         project = _create_test_structure(
+            tmp_path,
             [
                 "package.json",
                 "package-lock.json",
@@ -39,9 +38,10 @@ class TestFileFiltering:
         assert "package-lock.json" not in filenames
         assert "yarn.lock" not in filenames
 
-    def test_ignores_json_files(self) -> None:
+    def test_ignores_json_files(self, tmp_path: Path) -> None:
         """Generic .json files should be ignored (removed from default ext)."""
         project = _create_test_structure(
+            tmp_path,
             [
                 "data.json",
                 "config.json",
@@ -55,9 +55,10 @@ class TestFileFiltering:
         assert "data.json" not in filenames
         assert "config.json" not in filenames
 
-    def test_respects_custom_ignore_files(self) -> None:
+    def test_respects_custom_ignore_files(self, tmp_path: Path) -> None:
         """Standard ignores like node_modules should still work."""
         project = _create_test_structure(
+            tmp_path,
             [
                 "node_modules/pkg/index.js",
                 "src/app.js",
@@ -68,3 +69,50 @@ class TestFileFiltering:
         paths = result.files
         assert any("src/app.js" in p for p in paths)
         assert not any("node_modules" in p for p in paths)
+
+    def test_includes_dotenv_files(self, tmp_path: Path) -> None:
+        """Bare ``.env`` files should be matched by the ``.env`` extension."""
+        project = _create_test_structure(
+            tmp_path,
+            [
+                ".env",
+                "config/.env",
+                "README.md",
+            ]
+        )
+        result = walk_project_files(Path(project))
+
+        filenames = sorted(os.path.basename(f) for f in result.files)
+        assert filenames == [".env", ".env"]
+        assert result.files_scanned == 2
+
+    def test_records_file_sizes(self, tmp_path: Path) -> None:
+        """Each matched file's size is reported at the same index."""
+        project = _create_test_structure(tmp_path, ["empty.js"])
+        with open(os.path.join(project, "code.js"), "w") as fh:
+            fh.write("eval(x);\n")
+        result = walk_project_files(Path(project))
+
+        sizes = {os.path.basename(f): s for f, s in zip(result.files, result.sizes)}
+        assert sizes == {"empty.js": 0, "code.js": 9}
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs POSIX FIFOs")
+    def test_skips_symlinks_and_special_files(self, tmp_path: Path) -> None:
+        """Only regular files are collected; links and FIFOs are skipped."""
+        project = _create_test_structure(tmp_path, ["real.js"])
+        os.symlink(os.path.join(project, "real.js"), os.path.join(project, "link.js"))
+        os.mkfifo(os.path.join(project, "pipe.js"))
+        result = walk_project_files(Path(project))
+
+        assert [os.path.basename(f) for f in result.files] == ["real.js"]
+
+    def test_custom_scan_extensions(self, tmp_path: Path) -> None:
+        """Extension overrides accept any iterable or a single suffix."""
+        project = _create_test_structure(tmp_path, ["a.py", "b.js", "c.ts"])
+
+        for extensions in ({".py", ".ts"}, [".py", ".ts"]):
+            result = walk_project_files(Path(project), scan_extensions=extensions)
+            assert sorted(os.path.basename(f) for f in result.files) == ["a.py", "c.ts"]
+
+        result = walk_project_files(Path(project), scan_extensions=".py")
+        assert [os.path.basename(f) for f in result.files] == ["a.py"]